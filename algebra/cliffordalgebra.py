@@ -4,6 +4,7 @@ import functools
 import math
 import jax
 import jax.numpy as jnp
+import numpy as np
 
 from .metric import ShortLexBasisBladeOrder, construct_gmt
 
@@ -32,6 +33,7 @@ class CliffordAlgebra:
 
         Attributes:
             metric (jnp.array): The metric tensor for the algebra.
+            positive_definite (bool): Whether all entries of the metric are positive (Euclidean signature).
             num_bases (int): Number of basis vectors in the algebra.
             bbo (ShortLexBasisBladeOrder): Basis blade order for the algebra.
             dim (int): Dimension of the algebra.
@@ -39,6 +41,8 @@ class CliffordAlgebra:
             grades (list): Unique grades present in the algebra.
             subspaces (jnp.array): Array of subspace dimensions.
             n_subspaces (int): Number of subspaces in the algebra.
+            grade_of_blade (np.array): Index of the subspace (grade) of each blade.
+                - static int32 array, indexing with it broadcasts per-grade values to all blades.
             grade_to_slice (list): Mapping from grades to slices in the algebra.
             grade_to_index (list): Mapping from grades to indices.
             bbo_grades (jnp.array): Grades of the basis blades.
@@ -49,6 +53,7 @@ class CliffordAlgebra:
             geometric_product_paths_sum (int): Sum of the geometric product paths.
         """
         self.metric = jnp.array(metric, dtype=jnp.int32)
+        self.positive_definite = bool((np.asarray(metric) > 0).all())
         self.num_bases = len(self.metric)
         self.bbo = ShortLexBasisBladeOrder(self.num_bases)
         self.dim = len(self.metric)
@@ -60,6 +65,9 @@ class CliffordAlgebra:
         self.grades = jnp.unique(self.bbo.grades).tolist()
         self.subspaces = jnp.array([math.comb(self.dim, g) for g in self.grades])
         self.n_subspaces = len(self.grades)
+        self.grade_of_blade = np.repeat(
+            np.arange(self.n_subspaces, dtype=np.int32), np.asarray(self.subspaces)
+        )
         self.grade_to_slice = self._grade_to_slice(self.subspaces)
         self.grade_to_index = [
             jnp.arange(*s.indices(s.stop)) for s in self.grade_to_slice
@@ -97,9 +105,9 @@ class CliffordAlgebra:
             List of slice objects corresponding to each grade.
         """
         grade_to_slice = list()
-        subspaces = jnp.array(subspaces)
+        subspaces = np.asarray(subspaces)
         for grade in self.grades:
-            index_start = subspaces[:grade].sum()
+            index_start = int(subspaces[:grade].sum())
             index_end = index_start + math.comb(self.dim, grade)
             grade_to_slice.append(slice(index_start, index_end))
         return grade_to_slice
@@ -111,7 +119,8 @@ class CliffordAlgebra:
         Returns:
             A 3D boolean array indicating the presence of paths in the geometric product.
         """
-        gp_paths = jnp.zeros((self.dim + 1, self.dim + 1, self.dim + 1), dtype=bool)
+        gp_paths = np.zeros((self.dim + 1, self.dim + 1, self.dim + 1), dtype=bool)
+        cayley = np.asarray(self.cayley)
 
         for i in range(self.dim + 1):
             for j in range(self.dim + 1):
@@ -120,10 +129,10 @@ class CliffordAlgebra:
                     s_j = self.grade_to_slice[j]
                     s_k = self.grade_to_slice[k]
 
-                    m = self.cayley[s_i, s_j, s_k]
-                    gp_paths = gp_paths.at[i, j, k].set((m != 0).any())
+                    m = cayley[s_i, s_j, s_k]
+                    gp_paths[i, j, k] = (m != 0).any()
 
-        return gp_paths
+        return jnp.asarray(gp_paths)
 
     @functools.partial(jax.jit, static_argnums=(0,))
     def geometric_product(self, a, b, blades=None):
@@ -309,6 +318,19 @@ class CliffordAlgebra:
             blades = (blades, blades)
         return self.b(mv, mv, blades=blades)
 
+    def q_vector(self, v):
+        """
+        Computes the quadratic form of a vector, i.e. q(embed_grade(v, 1)).
+        For vectors it reduces to the diagonal metric, so no Cayley table is involved.
+
+        Args:
+            v: The vector of shape (..., algebra.dim).
+
+        Returns:
+            The quadratic form of shape (..., 1).
+        """
+        return jnp.einsum("...i,i,...i->...", v, self.metric, v)[..., None]
+
     def qs(self, mv, grades=None):
         """
         Computes the quadratic forms of a multivector for specific grades.
@@ -5,6 +5,7 @@ import itertools
 import operator
 
 import jax.numpy as jnp
+import numpy as np
 
 
 def _powerset(iterable):
@@ -23,16 +24,21 @@ class ShortLexBasisBladeOrder:
 
     def __init__(self, n_vectors):
         # Preallocate arrays to store mappings and grades.
-        self.index_to_bitmap = jnp.empty(2**n_vectors, dtype=jnp.int32)
-        self.grades = jnp.empty(2**n_vectors, dtype=jnp.int32)
-        self.bitmap_to_index = jnp.empty(2**n_vectors, dtype=jnp.int32)
+        # They are filled on the host and converted to jnp arrays once.
+        index_to_bitmap = np.empty(2**n_vectors, dtype=np.int32)
+        grades = np.empty(2**n_vectors, dtype=np.int32)
+        bitmap_to_index = np.empty(2**n_vectors, dtype=np.int32)
 
         # Iterate through the powerset to populate the mappings and grade arrays.
         for i, t in enumerate(_powerset([1 << i for i in range(n_vectors)])):
             bitmap = functools.reduce(operator.or_, t, 0)
-            self.index_to_bitmap = self.index_to_bitmap.at[i].set(bitmap)
-            self.grades = self.grades.at[i].set(len(t))
-            self.bitmap_to_index = self.bitmap_to_index.at[bitmap].set(i)
+            index_to_bitmap[i] = bitmap
+            grades[i] = len(t)
+            bitmap_to_index[bitmap] = i
+
+        self.index_to_bitmap = jnp.asarray(index_to_bitmap)
+        self.grades = jnp.asarray(grades)
+        self.bitmap_to_index = jnp.asarray(bitmap_to_index)
 
 
 def set_bit_indices(x: int):
@@ -47,10 +53,7 @@ def set_bit_indices(x: int):
 
 def count_set_bits(bitmap: int) -> int:
     """Counts the number of bits set to 1 in bitmap"""
-    count = 0
-    for _ in set_bit_indices(bitmap):
-        count += 1
-    return count
+    return bin(bitmap).count("1")
 
 
 def canonical_reordering_sign_euclidean(bitmap_a, bitmap_b):
@@ -102,8 +105,13 @@ def construct_gmt(index_to_bitmap, bitmap_to_index, signature):
     The table is represented as a 2^dim x 2^dim x 2^dim matrix, where each entry contains the sign of the product
     of two basis blades. The signature of the algebra determines the metric used.
     """
+    # the table is built from python integers on the host, avoiding a device update per entry
+    index_to_bitmap = np.asarray(index_to_bitmap).tolist()
+    bitmap_to_index = np.asarray(bitmap_to_index).tolist()
+    signature = np.asarray(signature).tolist()
+
     n = len(index_to_bitmap)
-    gmt_matrix = jnp.zeros((n, n, n), dtype=jnp.int32)
+    gmt_matrix = np.zeros((n, n, n), dtype=np.int32)
 
     for i in range(n):
         bitmap_i = index_to_bitmap[i]
@@ -113,6 +121,6 @@ def construct_gmt(index_to_bitmap, bitmap_to_index, signature):
             bitmap_v, mul = gmt_element(bitmap_i, bitmap_j, signature)
             v = bitmap_to_index[bitmap_v]
 
-            gmt_matrix = gmt_matrix.at[i, v, j].set(mul)
+            gmt_matrix[i, v, j] = mul
 
-    return gmt_matrix
+    return jnp.asarray(gmt_matrix)
@@ -1,6 +1,8 @@
+import jax.numpy as jnp
 from flax import linen as nn
 
 from modules.conv.convolution import CliffordSteerableConv
+from modules.core.linear import MVLinear
 from modules.core.norm import MVLayerNorm, GradeNorm
 from modules.core.mvgelu import MVGELU
 
@@ -22,6 +24,7 @@ class CSBasicBlock(nn.Module):
         bias_dims (tuple): Dimensions for the bias terms.
         stride (int): The stride of the convolution.
         expansion (int): The expansion factor for the number of channels.
+        dtype (jnp.dtype): The dtype of the convolutions and activations, normalization is computed in float32.
     """
 
     algebra: object
@@ -36,12 +39,14 @@ class CSBasicBlock(nn.Module):
     stride: int = 1
     expansion: int = 1
     padding_mode: str = "SAME"
+    dtype: object = jnp.float32
 
     @nn.compact
     def __call__(self, x):
         """
         Applies the basic block to a multivector input.
-            x -> conv1 -> norm1 -> gelu -> conv2 -> norm2 -> x + conv(x) -> gelu -> out
+            x -> conv1 -> norm1 -> gelu -> conv2 -> norm2 -> x + shortcut(x) -> gelu -> out
+            (the shortcut is a linear layer if only the number of channels changes)
 
         Args:
             x: The input multivector of shape (N, in_channels, X_1, ..., X_dim, 2**algebra.dim).
@@ -57,6 +62,7 @@ class CSBasicBlock(nn.Module):
             "bias_dims": self.bias_dims,
             "product_paths_sum": self.product_paths_sum,
             "padding_mode": self.padding_mode,
+            "dtype": self.dtype,
         }
 
         out = CliffordSteerableConv(
@@ -80,7 +86,17 @@ class CSBasicBlock(nn.Module):
         out = MVLayerNorm(self.algebra)(out) if self.norm else out
 
         # shortcut connection
-        if self.stride != 1 or self.in_channels != self.expansion * self.channels:
+        if self.stride == 1 and self.in_channels != self.expansion * self.channels:
+            # only the number of channels changes, so an equivariant grade-wise
+            # channel mixing is used instead of generating a steerable kernel
+            x = MVLinear(
+                self.algebra,
+                self.in_channels,
+                self.expansion * self.channels,
+                bias_dims=self.bias_dims,
+            )(x).astype(self.dtype)
+            x = MVLayerNorm(self.algebra)(x) if self.norm else x
+        elif self.stride != 1:
             x = CliffordSteerableConv(
                 c_in=self.in_channels,
                 c_out=self.expansion * self.channels,
@@ -96,6 +112,21 @@ class CSBasicBlock(nn.Module):
         return out
 
 
+class ScanCSBasicBlock(nn.Module):
+    """
+    Basic block with the (carry, x) -> (carry, y) signature required by nn.scan.
+
+    Attributes:
+        block_config (dict): The attributes of the wrapped CSBasicBlock.
+    """
+
+    block_config: dict
+
+    @nn.compact
+    def __call__(self, x, _):
+        return CSBasicBlock(**self.block_config)(x), None
+
+
 class CSResNetMnist(nn.Module):
     """
     Clifford-steerable ResNet-based CLassifier.
@@ -117,6 +148,14 @@ class CSResNetMnist(nn.Module):
         norm (bool): Whether to use normalization in the network.
         make_channels (bool): Whether to use the input and output channels as features.
             - only used for non-Euclidean data.
+        fused_embedding (bool): Whether to use a single 1x1 convolution instead of two for the input and output embeddings.
+            - the kernel network of the fused convolutions is twice as wide.
+        scan_blocks (bool): Whether to apply the basic blocks with nn.scan over stacked parameters.
+            - the blocks are traced and compiled once instead of once per block.
+        remat_blocks (bool): Whether to rematerialize the activations of the basic blocks in the backward pass.
+            - reduces activation memory at the cost of recomputing each block.
+        dtype (jnp.dtype): The dtype of the convolutions and activations, e.g. jnp.bfloat16 for mixed precision.
+            - parameters, normalization and the classifying layer are kept in float32.
     """
 
     algebra: object
@@ -128,10 +167,15 @@ class CSResNetMnist(nn.Module):
     kernel_size: int
     bias_dims: tuple
     product_paths_sum: int
+    out_features: int = 10
     blocks: tuple = (2, 2, 2, 2)
     norm: bool = True
     make_channels: bool = False
     padding_mode: str = "SAME"
+    fused_embedding: bool = False
+    scan_blocks: bool = False
+    remat_blocks: bool = False
+    dtype: object = jnp.float32
 
     def setup(self):
         self.conv_config = {
@@ -142,6 +186,12 @@ class CSResNetMnist(nn.Module):
             "hidden_dim": self.kernel_hidden_dim,
             "product_paths_sum": self.product_paths_sum,
             "padding_mode": self.padding_mode,
+            "dtype": self.dtype,
+        }
+
+        self.fused_conv_config = {
+            **self.conv_config,
+            "hidden_dim": 2 * self.kernel_hidden_dim,
         }
 
         self.block_config = {
@@ -155,50 +205,81 @@ class CSResNetMnist(nn.Module):
             "kernel_size": self.kernel_size,
             "bias_dims": self.bias_dims,
             "padding_mode": self.padding_mode,
+            "dtype": self.dtype,
         }
 
     @nn.compact
     def __call__(self, x):
         """
         Forward pass of the model.
-            x -> 2 1x1 convolutions -> N basic blocks -> 2 1x1 convolutions -> norm -> dense -> out
+            x -> 2 1x1 convolutions -> N basic blocks -> 2 1x1 convolutions -> norm -> average pool -> dense -> out
+            (a single 1x1 convolution on each side if fused_embedding is set)
 
         Args:
             x: The input multivector of shape (N, time_history, X_1, ..., X_dim, 2**algebra.dim).
 
         Returns:
-            The output multivector of shape (N, time_future, X_1, ..., X_dim, 2**algebra.dim).
+            The output logits of shape (N, out_features).
         """
         # Embedding convolutional layers
         in_channels = self.c_in if not self.make_channels else 1
         out_channels = self.c_out if not self.make_channels else 1
 
-        x = CliffordSteerableConv(
-            c_in=in_channels, c_out=self.hidden_channels, **self.conv_config
-        )(x)
-        x = MVGELU()(x)
-        x = CliffordSteerableConv(
-            c_in=self.hidden_channels, c_out=self.hidden_channels, **self.conv_config
-        )(x)
-        x = MVGELU()(x)
+        if self.fused_embedding:
+            x = CliffordSteerableConv(
+                c_in=in_channels, c_out=self.hidden_channels, **self.fused_conv_config
+            )(x)
+            x = MVGELU()(x)
+        else:
+            x = CliffordSteerableConv(
+                c_in=in_channels, c_out=self.hidden_channels, **self.conv_config
+            )(x)
+            x = MVGELU()(x)
+            x = CliffordSteerableConv(
+                c_in=self.hidden_channels, c_out=self.hidden_channels, **self.conv_config
+            )(x)
+            x = MVGELU()(x)
 
         # Basic blocks
-        for num_blocks in self.blocks:
-            for _ in range(num_blocks):
-                x = CSBasicBlock(**self.block_config)(x)
+        if self.scan_blocks:
+            # all blocks share the same configuration, so they are scanned as a single stack
+            Block = (
+                nn.remat(ScanCSBasicBlock, prevent_cse=False)
+                if self.remat_blocks
+                else ScanCSBasicBlock
+            )
+            x, _ = nn.scan(
+                Block,
+                variable_axes={"params": 0, "kernels": 0},
+                split_rngs={"params": True},
+                length=sum(self.blocks),
+            )(self.block_config, name="CSBasicBlocks")(x, None)
+        else:
+            # explicit names keep the parameter tree independent of remat_blocks
+            Block = nn.remat(CSBasicBlock) if self.remat_blocks else CSBasicBlock
+            for i in range(sum(self.blocks)):
+                x = Block(**self.block_config, name=f"CSBasicBlock_{i}")(x)
 
         # Output convolutional layers
-        x = CliffordSteerableConv(
-            c_in=self.hidden_channels, c_out=self.hidden_channels, **self.conv_config
-        )(x)
-        x = MVGELU()(x)
-        x = CliffordSteerableConv(
-            c_in=self.hidden_channels, c_out=out_channels, **self.conv_config
-        )(x)
+        if self.fused_embedding:
+            x = CliffordSteerableConv(
+                c_in=self.hidden_channels, c_out=out_channels, **self.fused_conv_config
+            )(x)
+        else:
+            x = CliffordSteerableConv(
+                c_in=self.hidden_channels, c_out=self.hidden_channels, **self.conv_config
+            )(x)
+            x = MVGELU()(x)
+            x = CliffordSteerableConv(
+                c_in=self.hidden_channels, c_out=out_channels, **self.conv_config
+            )(x)
 
         #Classifying layer
-        x = GradeNorm(self.algebra)(x)
+        x = GradeNorm(self.algebra)(x.astype(jnp.float32))
 
+        # Global average pooling over the spatial dimensions:
+        # (N, c_out, X_1, ..., X_dim, 2**algebra.dim) -> (N, c_out * 2**algebra.dim)
+        x = x.mean(axis=tuple(range(2, x.ndim - 1)))
         x = x.reshape(x.shape[0], -1)
     
         x = nn.Dense(features=self.out_features)(x)
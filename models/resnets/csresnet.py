@@ -1,3 +1,4 @@
+import jax.numpy as jnp
 from flax import linen as nn
 
 from modules.conv.convolution import CliffordSteerableConv, ComposedCliffordSteerableConv, ConditionedCliffordSteerableConv
@@ -23,6 +24,7 @@ class CSBasicBlock(nn.Module):
         bias_dims (tuple): Dimensions for the bias terms.
         stride (int): The stride of the convolution.
         expansion (int): The expansion factor for the number of channels.
+        dtype (jnp.dtype): The dtype of the convolutions and activations, normalization is computed in float32.
     """
 
     algebra: object
@@ -38,6 +40,7 @@ class CSBasicBlock(nn.Module):
     stride: int = 1
     expansion: int = 1
     padding_mode: str = "SAME"
+    dtype: object = jnp.float32
 
     @nn.compact
     def __call__(self, x):
@@ -59,6 +62,7 @@ class CSBasicBlock(nn.Module):
             "bias_dims": self.bias_dims,
             "product_paths_sum": self.product_paths_sum,
             "padding_mode": self.padding_mode,
+            "dtype": self.dtype,
         }
 
         if self.kernel_type == "default":
@@ -126,6 +130,8 @@ class CSResNet(nn.Module):
         norm (bool): Whether to use normalization in the network.
         make_channels (bool): Whether to use the input and output channels as features.
             - only used for non-Euclidean data.
+        dtype (jnp.dtype): The dtype of the convolutions and activations, e.g. jnp.bfloat16 for mixed precision.
+            - parameters and normalization are kept in float32, the output is returned in float32.
     """
 
     algebra: object
@@ -142,6 +148,7 @@ class CSResNet(nn.Module):
     norm: bool = True
     make_channels: bool = False
     padding_mode: str = "SAME"
+    dtype: object = jnp.float32
 
     def setup(self):
         self.conv_config = {
@@ -152,6 +159,7 @@ class CSResNet(nn.Module):
             "hidden_dim": self.kernel_hidden_dim,
             "product_paths_sum": self.product_paths_sum,
             "padding_mode": self.padding_mode,
+            "dtype": self.dtype,
         }
 
         self.block_config = {
@@ -166,6 +174,7 @@ class CSResNet(nn.Module):
             "kernel_type": self.kernel_type,
             "bias_dims": self.bias_dims,
             "padding_mode": self.padding_mode,
+            "dtype": self.dtype,
         }
 
     @nn.compact
@@ -213,4 +222,4 @@ class CSResNet(nn.Module):
         x = Convolution(
             c_in=self.hidden_channels, c_out=out_channels, **self.conv_config
         )(x)
-        return x
\ No newline at end of file
+        return x.astype(jnp.float32)
\ No newline at end of file
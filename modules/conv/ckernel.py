@@ -1,13 +1,9 @@
 import jax.numpy as jnp
 import jax
 from flax import linen as nn
-from jax.nn.initializers import ones
 
-from ..core.cayley import WeightedCayley
-from .shell import ComposedScalarShell, ScalarShell
-from .network import KernelNetwork
-from algebra.cliffordalgebra import CliffordAlgebra
-from .kernel import CliffordSteerableKernel, generate_kernel_grid, get_init_factor
+from .shell import ComposedScalarShell
+from .kernel import CliffordSteerableKernel
 
 
 def reshape_mv_tensor(algebra, tensor):
@@ -22,17 +18,45 @@ def reshape_back(algebra, tensor):
     B = N * algebra.n_blades
     return tensor.reshape(A,B,*dims)
 
-def _conv_kernel_11(k1, k2):
-    return jax.lax.conv(k1, k2, window_strides=(1, 1), padding="SAME")
+def conv_kernel(algebra, k1, k2):
+    """
+    Convolve two kernels block-wise, i.e. each (c_out, c_in) block of k1 with the same block of k2.
+    All blocks are convolved at once as a grouped convolution with one group per block.
 
-def _conv_kernel_14(k1, k2):
-    return jax.vmap(_conv_kernel_11, in_axes=(0, 0))(k1, k2)
+    Args:
+        algebra (object): An instance of CliffordAlgebra defining the algebraic structure.
+        k1 (jnp.ndarray): The kernel of shape (c_out * algebra.n_blades, c_in * algebra.n_blades, X_1, ..., X_dim).
+        k2 (jnp.ndarray): The kernel of shape (c_out * algebra.n_blades, c_in * algebra.n_blades, X_1, ..., X_dim).
 
-def conv_kernel(algebra, k1, k2):
-    k1 = reshape_mv_tensor(algebra, k1).transpose(0, 2, 1, 3, 4, 5)
-    k2 = reshape_mv_tensor(algebra, k2).transpose(0, 2, 1, 3, 4, 5)
-    k = jax.vmap(_conv_kernel_14, in_axes=(0, 0))(k1, k2)
-    k = k.transpose(0, 2, 1, 3, 4, 5)
+    Returns:
+        jnp.ndarray: The composed kernel of shape (c_out * algebra.n_blades, c_in * algebra.n_blades, X_1, ..., X_dim).
+    """
+    k1 = reshape_mv_tensor(algebra, k1)
+    k2 = reshape_mv_tensor(algebra, k2)
+    M, n_blades, N, _, *dims = k1.shape
+
+    # (M, n_blades, N, n_blades, X_1, ..., X_dim) -> (n_blades, M * N * n_blades, X_1, ..., X_dim)
+    k1 = jnp.moveaxis(k1, 1, 0).reshape(n_blades, M * N * n_blades, *dims)
+    # (M, n_blades, N, n_blades, X_1, ..., X_dim) -> (M * N * n_blades, n_blades, X_1, ..., X_dim)
+    k2 = jnp.moveaxis(k2, 1, 2).reshape(M * N * n_blades, n_blades, *dims)
+
+    # layouts are stated explicitly for any number of spatial axes:
+    # (N, C, X_1, ..., X_dim) for k1 and the output, (O, I, X_1, ..., X_dim) for k2
+    layout = tuple(range(k1.ndim))
+    k = jax.lax.conv_general_dilated(
+        k1,
+        k2,
+        window_strides=(1,) * len(dims),
+        padding="SAME",
+        dimension_numbers=jax.lax.ConvDimensionNumbers(
+            lhs_spec=layout, rhs_spec=layout, out_spec=layout
+        ),
+        feature_group_count=M * N,
+        precision=jax.lax.Precision.HIGHEST,
+    )
+
+    # (n_blades, M * N * n_blades, X_1, ..., X_dim) -> (M, n_blades, N, n_blades, X_1, ..., X_dim)
+    k = jnp.moveaxis(k.reshape(n_blades, M, N, n_blades, *dims), 0, 1)
     k = reshape_back(algebra, k)
     return k
 
@@ -73,32 +97,24 @@ class ComposedCliffordSteerableKernel(nn.Module):
         Returns: Composed kernel of shape (c_out * algebra.n_blades, c_in * algebra.n_blades, X_1, ..., X_dim).
         """
 
-        # Generate individual kernels
-        k1, rel_pos, factor, weighted_cayley = CliffordSteerableKernel(*self.kernel_params)()
-        k2, _, _, _ = CliffordSteerableKernel(*self.kernel_params)()
+        # Generate both individual kernels at once from stacked parameters
+        k, rel_pos, factor, _ = nn.vmap(
+            CliffordSteerableKernel,
+            variable_axes={"params": 0},
+            split_rngs={"params": True},
+            in_axes=None,
+            out_axes=(0, None, None, 0),
+            axis_size=2,
+        )(*self.kernel_params)()
+        k1, k2 = k[0], k[1]
 
         # Convolve the kernels to get the composed kernel
         k = conv_kernel(self.algebra, k1, k2)
 
-        # Compute kernel mask
-        #shell = ScalarShell(self.algebra, self.c_in, self.c_out)(rel_pos).reshape(
-        #    -1, self.c_out, self.c_in, 2**self.algebra.dim
-        #)
-
-
-        #Shell head: partial weighted geometric product
-        #shell = jnp.einsum("noik,oiklm->olimn", shell, weighted_cayley)
-
-        # Reshape to final kernel
-        #shell = shell.reshape(
-        #    self.c_out * self.algebra.n_blades,
-        #    self.c_in * self.algebra.n_blades,
-        #    *(self.algebra.dim * [self.kernel_size])
-        #)
-
         #Compute the shell for the composed kernel
         shell = ComposedScalarShell(self.algebra, self.c_in, self.c_out)(rel_pos) #output shape: (N, c_out, c_in, 2**algebra.dim, 2**algebra.dim)
-        shell = shell.transpose(1, 2, 3, 4, 0).reshape(self.c_out * 2 ** self.algebra.dim, self.c_in * 2 ** self.algebra.dim, *(self.algebra.dim * [self.kernel_size]))
+        # same layout as the kernel: (N, c_out, c_in, n_blades, n_blades) -> (c_out, n_blades, c_in, n_blades, N)
+        shell = shell.transpose(1, 3, 2, 4, 0).reshape(self.c_out * 2 ** self.algebra.dim, self.c_in * 2 ** self.algebra.dim, *(self.algebra.dim * [self.kernel_size]))
 
 
         # Apply the scalar shell to the composed kernel
@@ -1,13 +1,11 @@
 import jax.numpy as jnp
-import jax
 from flax import linen as nn
 from jax.nn.initializers import ones
 
 from ..core.cayley import WeightedCayley
 from .shell import ScalarShell, compute_scalar_shell
 from .network import KernelNetwork
-from algebra.cliffordalgebra import CliffordAlgebra
-from .kernel import CliffordSteerableKernel, generate_kernel_grid, get_init_factor
+from .kernel import generate_kernel_grid, get_init_factor
 
 
 class CondCliffordSteerableKernel(nn.Module):
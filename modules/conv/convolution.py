@@ -27,6 +27,11 @@ class CliffordSteerableConv(nn.Module):
         padding (bool): Whether to use padding in the convolution.
         stride (int): The stride of the convolution.
         bias (bool): Whether to use bias in the convolution.
+        dtype (jnp.dtype): The dtype of the computation, e.g. jnp.bfloat16 for mixed precision.
+            - parameters and the kernel network are kept in float32.
+
+    The kernel depends only on the parameters. When applied (not initialized) with mutable=["kernels"],
+    the layer stores its kernel there; when applied with a filled "kernels" collection, it reuses it.
     """
 
     algebra: object
@@ -41,6 +46,7 @@ class CliffordSteerableConv(nn.Module):
     stride: int = 1
     bias: bool = True
     padding_mode: str = "SAME"
+    dtype: object = jnp.float32
 
     @nn.compact
     def __call__(self, x):
@@ -51,9 +57,11 @@ class CliffordSteerableConv(nn.Module):
         Returns:
         The output multivector of shape (N, c_out, X_1, ..., X_dim, 2**algebra.dim).
         """
-        # Initializing kernel
-            
-        kernel, _, _, _ = CliffordSteerableKernel(
+        # Initializing kernel (or reusing the one cached in the "kernels" collection)
+        if self.has_variable("kernels", "kernel"):
+            kernel = self.get_variable("kernels", "kernel")
+        else:
+            kernel, _, _, _ = CliffordSteerableKernel(
                 algebra=self.algebra,
                 c_in=self.c_in,
                 c_out=self.c_out,
@@ -63,6 +71,10 @@ class CliffordSteerableConv(nn.Module):
                 bias_dims=self.bias_dims,
                 product_paths_sum=self.product_paths_sum,
                 )()
+            # never cached during init, so init returns only parameters and a
+            # stale kernel cannot shadow them in a later apply
+            if self.is_mutable_collection("kernels") and not self.is_initializing():
+                self.put_variable("kernels", "kernel", kernel)
 
         # Initializing bias
         if self.bias:
@@ -100,8 +112,8 @@ class CliffordSteerableConv(nn.Module):
 
         # Convolution
         output = jax.lax.conv(
-            inputs,
-            kernel,
+            inputs.astype(self.dtype),
+            kernel.astype(self.dtype),
             window_strides=(self.stride,) * self.algebra.dim,
             padding=padding,
         )
@@ -120,7 +132,7 @@ class CliffordSteerableConv(nn.Module):
         )
 
         if self.bias:
-            output = output + bias
+            output = output + bias.astype(self.dtype)
 
         return output
 
@@ -143,6 +155,11 @@ class ComposedCliffordSteerableConv(nn.Module):
         padding (bool): Whether to use padding in the convolution.
         stride (int): The stride of the convolution.
         bias (bool): Whether to use bias in the convolution.
+        dtype (jnp.dtype): The dtype of the computation, e.g. jnp.bfloat16 for mixed precision.
+            - parameters and the kernel network are kept in float32.
+
+    The kernel depends only on the parameters. When applied (not initialized) with mutable=["kernels"],
+    the layer stores its kernel there; when applied with a filled "kernels" collection, it reuses it.
     """
 
     algebra: object
@@ -157,6 +174,7 @@ class ComposedCliffordSteerableConv(nn.Module):
     stride: int = 1
     bias: bool = True
     padding_mode: str = "SAME"
+    dtype: object = jnp.float32
 
     @nn.compact
     def __call__(self, x):
@@ -167,19 +185,25 @@ class ComposedCliffordSteerableConv(nn.Module):
         Returns:
         The output multivector of shape (N, c_out, X_1, ..., X_dim, 2**algebra.dim).
         """
-        # Initializing kernel
+        # Initializing kernel (or reusing the one cached in the "kernels" collection)
+        if self.has_variable("kernels", "kernel"):
+            kernel = self.get_variable("kernels", "kernel")
+        else:
+            kernel = ComposedCliffordSteerableKernel(
+                algebra=self.algebra,
+                c_in=self.c_in,
+                c_out=self.c_out,
+                kernel_size=self.kernel_size,
+                num_layers=self.num_layers,
+                hidden_dim=self.hidden_dim,
+                bias_dims=self.bias_dims,
+                product_paths_sum=self.product_paths_sum,
+                )()
+            # never cached during init, so init returns only parameters and a
+            # stale kernel cannot shadow them in a later apply
+            if self.is_mutable_collection("kernels") and not self.is_initializing():
+                self.put_variable("kernels", "kernel", kernel)
 
-        kernel = ComposedCliffordSteerableKernel(
-            algebra=self.algebra,
-            c_in=self.c_in,
-            c_out=self.c_out,
-            kernel_size=self.kernel_size,
-            num_layers=self.num_layers,
-            hidden_dim=self.hidden_dim,
-            bias_dims=self.bias_dims,
-            product_paths_sum=self.product_paths_sum,
-            )()
-        
         # Initializing bias
         if self.bias:
             bias_param = self.param(
@@ -216,8 +240,8 @@ class ComposedCliffordSteerableConv(nn.Module):
 
         # Convolution
         output = jax.lax.conv(
-            inputs,
-            kernel,
+            inputs.astype(self.dtype),
+            kernel.astype(self.dtype),
             window_strides=(self.stride,) * self.algebra.dim,
             padding=padding,
         )
@@ -236,7 +260,7 @@ class ComposedCliffordSteerableConv(nn.Module):
         )
 
         if self.bias:
-            output = output + bias
+            output = output + bias.astype(self.dtype)
 
         return output
     
@@ -272,6 +296,8 @@ class ConditionedCliffordSteerableConv(nn.Module):
         padding (bool): Whether to use padding in the convolution.
         stride (int): The stride of the convolution.
         bias (bool): Whether to use bias in the convolution.
+        dtype (jnp.dtype): The dtype of the computation, e.g. jnp.bfloat16 for mixed precision.
+            - parameters and the kernel network are kept in float32.
     """
 
     algebra: object
@@ -286,8 +312,7 @@ class ConditionedCliffordSteerableConv(nn.Module):
     stride: int = 1
     bias: bool = True
     padding_mode: str = "SAME"
-
-
+    dtype: object = jnp.float32
 
     @nn.compact
     def __call__(self, x):
@@ -311,7 +336,8 @@ class ConditionedCliffordSteerableConv(nn.Module):
             "product_paths_sum": self.product_paths_sum,
             "padding_mode": self.padding_mode,
             "stride": self.stride,
-            "bias": self.bias
+            "bias": self.bias,
+            "dtype": self.dtype,
         }
         
         return jax.vmap(BatchlessConditionedCliffordSteerableConv(**conv_config))(x)
@@ -336,6 +362,8 @@ class BatchlessConditionedCliffordSteerableConv(nn.Module):
         padding (bool): Whether to use padding in the convolution.
         stride (int): The stride of the convolution.
         bias (bool): Whether to use bias in the convolution.
+        dtype (jnp.dtype): The dtype of the computation, e.g. jnp.bfloat16 for mixed precision.
+            - parameters and the kernel network are kept in float32.
     """
 
     algebra: object
@@ -351,7 +379,8 @@ class BatchlessConditionedCliffordSteerableConv(nn.Module):
     stride: int = 1
     bias: bool = True
     padding_mode: str = "SAME"
-    
+    dtype: object = jnp.float32
+
     def setup(self):
         """Set up circular mask for pooling"""
         self.circular_mask = create_circular_mask(self.mask_size)
@@ -417,8 +446,8 @@ class BatchlessConditionedCliffordSteerableConv(nn.Module):
 
         # Convolution
         output = jax.lax.conv(
-            inputs,
-            kernel,
+            inputs.astype(self.dtype),
+            kernel.astype(self.dtype),
             window_strides=(self.stride,) * self.algebra.dim,
             padding=padding,
         )
@@ -440,6 +469,6 @@ class BatchlessConditionedCliffordSteerableConv(nn.Module):
         output = jnp.squeeze(output, axis=0)
 
         if self.bias:
-            output = output + bias
+            output = output + bias.astype(self.dtype)
 
         return output
\ No newline at end of file
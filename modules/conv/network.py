@@ -2,7 +2,6 @@ from flax import linen as nn
 
 from ..core.fcgp import FullyConnectedSteerableGeometricProductLayer
 from ..core.mvgelu import MVGELU
-from ..core.norm import GradeNorm
 
 
 class KernelNetwork(nn.Module):
@@ -1,8 +1,11 @@
+import functools
 from flax import linen as nn
+import jax
 import jax.numpy as jnp
 from jax.nn.initializers import uniform
 
 
+@functools.partial(jax.jit, static_argnums=(0,))
 def compute_scalar_shell(algebra: object, v: jnp.ndarray, sigma: jnp.ndarray):
     """
     Compute scalar shell for the output of the kernel network given a vector.
@@ -16,9 +19,11 @@ def compute_scalar_shell(algebra: object, v: jnp.ndarray, sigma: jnp.ndarray):
     Returns:
         jnp.ndarray: The output scalar of shape (N, 1, 1).
     """
-    q_v = algebra.q(algebra.embed_grade(v, 1))
-    sgn = jnp.where(q_v >= 0, 1, -1)
-    return sgn * jnp.exp(-jnp.abs(q_v) / (2 * sigma**2))
+    q_v = algebra.q_vector(v)
+    if algebra.positive_definite:
+        # q_v >= 0 for every vector, so the sign of the shell is known statically
+        return jnp.exp(-q_v / (2 * sigma**2))
+    return jnp.copysign(jnp.exp(-jnp.abs(q_v) / (2 * sigma**2)), q_v)
 
 
 class ScalarShell(nn.Module):
@@ -57,11 +62,12 @@ class ScalarShell(nn.Module):
         )
 
         # broadcasting along the grades
-        kernel_width = jnp.repeat(kernel_width, self.algebra.subspaces, axis=-1)
+        kernel_width = kernel_width[..., self.algebra.grade_of_blade]
         kernel_width = kernel_width.reshape(1, -1, 2**self.algebra.dim)
         return compute_scalar_shell(self.algebra, x, kernel_width)
 
 
+@functools.partial(jax.jit, static_argnums=(0,))
 def compute_composed_scalar_shell(algebra: object, v: jnp.ndarray, sigma: jnp.ndarray):
     """
     Compute scalar shell for the output of the composed kernel given a vector.
@@ -75,13 +81,12 @@ def compute_composed_scalar_shell(algebra: object, v: jnp.ndarray, sigma: jnp.nd
     Returns:
         jnp.ndarray: The output scalar of shape (N, c_out, c_in, 2**algebra.dim, 2**algebra.dim).
     """
-    q_v = algebra.q(algebra.embed_grade(v, 1))  # Shape: (positions, 1, 1)
+    q_v = algebra.q_vector(v)  # Shape: (positions, 1, 1)
     q_v = q_v.reshape(-1, 1, 1, 1, 1)  # Shape: (positions, 1, 1, 1, 1)
-
-    sgn = jnp.where(q_v >= 0, 1, -1)
-    scalar_shell = sgn * jnp.exp(-jnp.abs(q_v) / (2 * sigma**2))
-    print("The shape of scalar shell", scalar_shell.shape)
-    return scalar_shell  # Shape: (positions, c_out, c_in, n_blades, n_blades)
+    if algebra.positive_definite:
+        # q_v >= 0 for every vector, so the sign of the shell is known statically
+        return jnp.exp(-q_v / (2 * sigma**2))  # Shape: (positions, c_out, c_in, n_blades, n_blades)
+    return jnp.copysign(jnp.exp(-jnp.abs(q_v) / (2 * sigma**2)), q_v)  # Shape: (positions, c_out, c_in, n_blades, n_blades)
 
 
 class ComposedScalarShell(nn.Module):
@@ -112,11 +117,10 @@ class ComposedScalarShell(nn.Module):
                 (self.c_out, self.c_in, self.algebra.n_subspaces, self.algebra.n_subspaces),
             ) + 0.4
         )
-        # Expand kernel_width across output
-        kernel_width_out = jnp.repeat(kernel_width, self.algebra.subspaces, axis=-2)
-
-        # Expand kernel_width across input
-        kernel_width = jnp.repeat(kernel_width_out, self.algebra.subspaces, axis=-1) #shape (c_out, c_in, n_blades, n_blades)
+        # Expand kernel_width across output and input blades in a single gather
+        kernel_width = kernel_width[
+            :, :, self.algebra.grade_of_blade[:, None], self.algebra.grade_of_blade[None, :]
+        ]  # shape (c_out, c_in, n_blades, n_blades)
         kernel_width = kernel_width[None, :, :, :, :]
 
         # Compute the scalar shell
@@ -46,11 +46,12 @@ class WeightedCayley(nn.Module):
         weight = weight.at[:, :, self.algebra.geometric_product_paths].set(weight_init)
 
         # Repeating the weights across subspaces
-        subspaces = self.algebra.subspaces
-        weight_repeated = (
-            weight.repeat(subspaces, axis=-3)
-            .repeat(subspaces, axis=-2)
-            .repeat(subspaces, axis=-1)
-        )
+        grade_of_blade = self.algebra.grade_of_blade
+        weight_repeated = weight[
+            ...,
+            grade_of_blade[:, None, None],
+            grade_of_blade[None, :, None],
+            grade_of_blade[None, None, :],
+        ]
 
         return self.algebra.cayley * weight_repeated
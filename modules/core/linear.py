@@ -49,7 +49,7 @@ class MVLinear(nn.Module):
 
         # Forward pass for each grade or whole multivector
         if self.subspaces:
-            weight = jnp.repeat(weight, self.algebra.subspaces, axis=-1)
+            weight = weight[..., self.algebra.grade_of_blade]
             result = jnp.einsum("bm...i, nmi->bn...i", input, weight)
         else:
             result = jnp.einsum("bm...i, nm->bn...i", input, weight)
@@ -23,10 +23,12 @@ class MVLayerNorm(nn.Module):
 
         Returns:
             output (jnp.ndarray): normalized multivector of shape (..., 2**algebra.dim).
+                - the norm is always computed in float32, the output has the dtype of the input.
         """
-        norms = self.algebra.norm(input).mean(axis=1, keepdims=True)
-        outputs = input / (norms + 1e-6)
-        return outputs
+        outputs = input.astype(jnp.float32)
+        norms = self.algebra.norm(outputs).mean(axis=1, keepdims=True)
+        outputs = outputs / (norms + 1e-6)
+        return outputs.astype(input.dtype)
 
 
 class GradeNorm(nn.Module):
@@ -57,7 +59,7 @@ class GradeNorm(nn.Module):
         factor = jax.lax.broadcast_in_dim(
             factor, norms.shape, (0, 1, len(norms.shape) - 1)
         )
-        norms = jnp.repeat(
-            jax.nn.sigmoid(factor) * (norms - 1) + 1, self.algebra.subspaces, axis=-1
-        )
+        norms = (jax.nn.sigmoid(factor) * (norms - 1) + 1)[
+            ..., self.algebra.grade_of_blade
+        ]
         return input / (norms + 1e-6)
@@ -69,8 +69,9 @@ def train_eval_pmap_fn(experiment: str):
     }
     compute_losses = compute_losses_dict[experiment]
 
-    @functools.partial(jax.pmap, axis_name="devices")
-    @jax.jit
+    # the replicated state is consumed by each step, so its buffers are donated
+    # to let XLA update parameters and optimizer moments in place
+    @functools.partial(jax.pmap, axis_name="devices", donate_argnums=(0,))
     def train_step(
         state: train_state.TrainState,
         inputs: jnp.ndarray,
@@ -87,18 +88,32 @@ def train_eval_pmap_fn(experiment: str):
         state = state.apply_gradients(grads=grads)
         return state, metrics
 
+    # steerable kernels depend only on the parameters, so during evaluation
+    # they are collected during the first batch and reused for the others
+    @functools.partial(jax.pmap, axis_name="devices")
+    def kernel_eval_step(
+        state: train_state.TrainState,
+        inputs: jnp.ndarray,
+        targets: jnp.array,
+    ):
+        outputs, variables = state.apply_fn(
+            {"params": state.params}, inputs, mutable=["kernels"]
+        )
+        _, metrics = compute_losses(inputs=outputs, targets=targets)
+        return metrics, variables.get("kernels", {})
+
     @functools.partial(jax.pmap, axis_name="devices")
-    @jax.jit
     def eval_step(
         state: train_state.TrainState,
+        kernels: dict,
         inputs: jnp.ndarray,
         targets: jnp.array,
     ):
-        outputs = state.apply_fn({"params": state.params}, inputs)
+        outputs = state.apply_fn({"params": state.params, "kernels": kernels}, inputs)
         _, metrics = compute_losses(inputs=outputs, targets=targets)
         return metrics
 
-    return train_step, eval_step
+    return train_step, kernel_eval_step, eval_step
 
 
 def unreplicate_metrics(metrics):
@@ -126,7 +141,7 @@ def train_and_evaluate(
     **kwargs,
 ):
     print(f"Training on {jax.device_count()} devices ({jax.devices()[0].device_kind}).")
-    train_step, eval_step = train_eval_pmap_fn(experiment)
+    train_step, kernel_eval_step, eval_step = train_eval_pmap_fn(experiment)
     # Replicate the initial model state to the devices
     state = flax.jax_utils.replicate(state)
     train_batch_metrics = []
@@ -145,10 +160,14 @@ def train_and_evaluate(
             train_batch_metrics.append(metrics)
 
         ### Validation ###
+        kernels = None
         for inputs, targets in valid_loader:
             inputs = shard(inputs)
             targets = shard(targets)
-            metrics = eval_step(state, inputs, targets)
+            if kernels is None:
+                metrics, kernels = kernel_eval_step(state, inputs, targets)
+            else:
+                metrics = eval_step(state, kernels, inputs, targets)
             metrics = unreplicate_metrics(metrics)
             valid_batch_metrics.append(metrics)
 
@@ -210,7 +229,7 @@ def test(
     **kwargs,
 ):
     print(f"Testing on {jax.device_count()} devices.")
-    _, eval_step = train_eval_pmap_fn(experiment)
+    _, kernel_eval_step, eval_step = train_eval_pmap_fn(experiment)
     state = flax.jax_utils.replicate(state)
 
     # if test_loaders is a single loader, convert it to a dict
@@ -220,6 +239,7 @@ def test(
     for loader_key, loader in test_loaders.items():
         print(f"Testing with loader: {loader_key}")
         test_batch_metrics = []
+        kernels = None
 
         pbar = tqdm.tqdm(range(1, TEST_AGGR_STEPS[experiment] + 1))
         for agg_step in pbar:
@@ -227,7 +247,10 @@ def test(
             for inputs, targets in loader:
                 inputs = shard(inputs)
                 targets = shard(targets)
-                metrics = eval_step(state, inputs, targets)
+                if kernels is None:
+                    metrics, kernels = kernel_eval_step(state, inputs, targets)
+                else:
+                    metrics = eval_step(state, kernels, inputs, targets)
                 metrics = unreplicate_metrics(metrics)
                 test_batch_metrics.append(metrics)
 